@@ -37,12 +37,16 @@ SYS_CHECK_INTERVAL = 10                     # 10 seconds
 SYS_HEARTBEAT_INTERVAL = 60*60              # 1 hour
 DISK_CHECK_INTERVAL = 60*60*24              # 24 hours
 HEALTHCHECK_PING_INTERVAL = 60*60           # 1 hour
+NET_CHECK_INTERVAL = 60                     # 1 minute
+NET_HEARTBEAT_INTERVAL = 60*60              # 1 hour
 
 # THRESHOLDS
 RAM_USAGE_THRESHOLD = 80    # %
 CPU_USAGE_THRESHOLD = 80    # %
 CPU_TEMP_THRESHOLD = 75     # °C
 DISK_THRESHOLD = 80         # %
+NET_LATENCY_THRESHOLD = 200 # ms, compared against the p95 latency of a check
+NET_LOSS_THRESHOLD = 20     # %, lost probes of a check (1 of 5 is tolerated)
 
 # DRIVE CONFIG
 EXTERNAL_DRIVES = [
@@ -62,3 +66,27 @@ EXTERNAL_DRIVES = [
      "device": "/dev/disk/by-id/ata-TOSHIBA_MQ01ABD100_34KNT42CT",
      "type": "smart"}
 ]
+
+# NETWORK PROBE CONFIG
+NET_PROBE_TIMEOUT = 2       # seconds per probe
+NET_PROBE_COUNT = 5         # probes per target and check
+NET_PROBE_SPACING = 0.2     # seconds between probes of the same target
+NET_PROBE_HISTORY = 300     # results kept per target for the rolling heartbeat percentiles
+
+# type "tcp" connects to host:port, "http" sends a GET to url, "dns" asks the resolver at host:port for query
+NET_TARGETS = [
+    {"name": "Gateway",
+     "type": "tcp",
+     "host": "192.168.0.1",
+     "port": 80},
+
+    {"name": "DNS resolver",
+     "type": "dns",
+     "host": "192.168.0.1",
+     "port": 53,
+     "query": "cloud.hofmannmichael.at"},
+
+    {"name": "Nextcloud",
+     "type": "http",
+     "url": "https://cloud.hofmannmichael.at/status.php"}
+]
@@ -4,6 +4,7 @@ DNS = get_service_logger("dns")
 SYS = get_service_logger("sys")
 EMAIL = get_service_logger("email")
 DISKS = get_service_logger("disks")
+NET = get_service_logger("net")
 MAIN = get_service_logger("main")
 
-ALL_LOGGERS = [DNS, SYS, EMAIL, DISKS, MAIN]
+ALL_LOGGERS = [DNS, SYS, EMAIL, DISKS, NET, MAIN]
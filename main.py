@@ -9,6 +9,7 @@ from utils import generic_utils
 from utils.generic_utils import get_local_time, ping_healthchecks_io
 from services.disks import monitor_disks
 from services.dns import monitor_dns_record
+from services.net import monitor_net
 from utils.email_utils import send_email, log_critical_with_email
 from services.sys import monitor_sys
 
@@ -87,6 +88,8 @@ def monitor_loop():
     last_sys_heartbeat = 0
     last_disks_check = 0
     last_healtcheck_ping = 0
+    last_net_check = 0
+    last_net_heartbeat = 0
 
     last_report = ""
 
@@ -125,6 +128,14 @@ def monitor_loop():
             run_thread(target=ping_healthchecks_io, name="ping-healthcheck")
             last_healtcheck_ping = now
 
+        if now - last_net_check > configuration.NET_CHECK_INTERVAL >= 0:
+            should_heartbeat = (now - last_net_heartbeat) > configuration.NET_HEARTBEAT_INTERVAL
+            loggers.MAIN.info(f"running task net. heartbeat = {should_heartbeat}")
+            run_thread(target=monitor_net, name="net", args=(should_heartbeat,))
+            last_net_check = now
+            if should_heartbeat:
+                last_net_heartbeat = now
+
         time.sleep(configuration.MAIN_LOOP_INTERVAL)
 
 
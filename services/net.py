@@ -0,0 +1,225 @@
+import asyncio
+import math
+import random
+import ssl
+import struct
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import loggers
+from config import configuration
+
+
+# target name -> last results, latency in ms or None if the probe was lost
+_history: dict[str, deque[float | None]] = {}
+
+# Loading the CA bundle is slow, do it once instead of inside every timed HTTPS probe
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+async def probe_tcp(host: str, port: int) -> None:
+    """Opens and closes a TCP connection. Throws exception on failure."""
+    _, writer = await asyncio.open_connection(host, port)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def probe_http(url: str) -> None:
+    """Sends a GET request and reads the status line. Throws exception on failure or server error."""
+    parts = urlsplit(url)
+    if not parts.hostname:
+        raise ValueError(f"No host in URL {url}")
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
+    host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    if parts.port:
+        host += f":{parts.port}"
+
+    reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=_SSL_CONTEXT if https else None)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        status_line = await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    status = int(status_line.split()[1])
+    if status >= 500:
+        raise ConnectionError(f"HTTP status {status}")
+
+
+class _DnsProtocol(asyncio.DatagramProtocol):
+    def __init__(self, query_id: int):
+        self.query_id = query_id
+        self.answer = asyncio.get_running_loop().create_future()
+
+    def datagram_received(self, data, addr):
+        if len(data) < 12 or self.answer.done():
+            return
+        response_id, flags = struct.unpack("!HH", data[:4])
+        # Ignore stray datagrams, only accept a response (QR bit) to our query
+        if response_id == self.query_id and flags & 0x8000:
+            self.answer.set_result(data)
+
+    def error_received(self, exc):
+        if not self.answer.done():
+            self.answer.set_exception(exc)
+
+
+async def probe_dns(host: str, port: int, query: str) -> None:
+    """Asks the resolver at host:port for the A record of query. Throws exception on failure."""
+    query_id = random.randint(0, 0xFFFF)
+    question = b"".join(bytes([len(label)]) + label.encode("ascii") for label in query.strip(".").split("."))
+    # Header: id, flags (recursion desired), 1 question; then qname, qtype A, qclass IN
+    packet = struct.pack("!HHHHHH", query_id, 0x0100, 1, 0, 0, 0) + question + b"\x00" + struct.pack("!HH", 1, 1)
+
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(lambda: _DnsProtocol(query_id), remote_addr=(host, port))
+    try:
+        transport.sendto(packet)
+        data = await protocol.answer
+    finally:
+        transport.close()
+
+    rcode = data[3] & 0x0F
+    # NXDOMAIN (3) still means the resolver answered, everything else is a resolver failure
+    if rcode not in (0, 3):
+        raise ConnectionError(f"DNS response code {rcode}")
+
+
+_REQUIRED_KEYS = {
+    "tcp": ["host", "port"],
+    "http": ["url"],
+    "dns": ["host", "query"],
+}
+
+
+def validate_target(target: dict) -> str | None:
+    """Returns a description of what is wrong with a target config, or None if it is usable."""
+    if "name" not in target:
+        return f"Target {target} has no name"
+    if target.get("type") not in _REQUIRED_KEYS:
+        return f"Target {target['name']} has unknown probe type {target.get('type')}"
+    missing = [key for key in _REQUIRED_KEYS[target["type"]] if key not in target]
+    if missing:
+        return f"Target {target['name']} is missing {missing}"
+    return None
+
+
+def _get_probe(target: dict):
+    if target["type"] == "tcp":
+        return probe_tcp(target["host"], target["port"])
+    elif target["type"] == "http":
+        return probe_http(target["url"])
+    return probe_dns(target["host"], target.get("port", 53), target["query"])
+
+
+async def measure(target: dict) -> tuple[float | None, Exception | None]:
+    """Runs one probe against target. Returns (latency in ms, None), or (None, error) if the probe failed or timed out."""
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_get_probe(target), timeout=configuration.NET_PROBE_TIMEOUT)
+    except (OSError, asyncio.TimeoutError, ValueError, IndexError) as e:
+        return None, e
+    return (time.perf_counter() - start) * 1000, None
+
+
+async def probe_target(target: dict) -> tuple[list[float | None], Exception | None]:
+    """Probes target NET_PROBE_COUNT times. Returns the results and last error of this round and adds the results to the history."""
+    history = _history.setdefault(target["name"], deque(maxlen=configuration.NET_PROBE_HISTORY))
+    results = []
+    last_error = None
+    for i in range(configuration.NET_PROBE_COUNT):
+        if i:
+            await asyncio.sleep(configuration.NET_PROBE_SPACING)
+        latency, error = await measure(target)
+        results.append(latency)
+        if error is not None:
+            last_error = error
+    history.extend(results)
+    return results, last_error
+
+
+def describe_error(error: Exception) -> str:
+    if isinstance(error, asyncio.TimeoutError):
+        return f"timeout after {configuration.NET_PROBE_TIMEOUT}s"
+    return f"{type(error).__name__}: {error}"
+
+
+async def probe_all(targets: list[dict]) -> list[tuple[list[float | None], Exception | None]]:
+    """Probes all targets concurrently on the running event loop."""
+    return await asyncio.gather(*(probe_target(target) for target in targets))
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of values, which must not be empty."""
+    ordered = sorted(values)
+    index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def get_stats(results) -> dict[str, float] | None:
+    """Returns loss in % and latency percentiles in ms over the given probe results."""
+    if not results:
+        return None
+
+    latencies = [latency for latency in results if latency is not None]
+    stats = {
+        "samples": len(results),
+        "loss": 100 * (len(results) - len(latencies)) / len(results),
+    }
+    if latencies:
+        stats.update({
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        })
+    return stats
+
+
+def format_stats(name: str, stats: dict[str, float]) -> str:
+    if "p50" not in stats:
+        return f"{name}: loss {stats['loss']:.1f}% over {stats['samples']} probes"
+    return (f"{name}: loss {stats['loss']:.1f}% | "
+            f"p50 {stats['p50']:.1f}ms p95 {stats['p95']:.1f}ms p99 {stats['p99']:.1f}ms "
+            f"over {stats['samples']} probes")
+
+
+def monitor_net(log_heartbeat: bool = False, targets: list[dict] | None = None):
+    if targets is None:
+        targets = configuration.NET_TARGETS
+
+    valid_targets = []
+    for target in targets:
+        problem = validate_target(target)
+        if problem:
+            loggers.NET.error(f"INVALID TARGET: {problem}. Skipping it.")
+        else:
+            valid_targets.append(target)
+
+    rounds = asyncio.run(probe_all(valid_targets))
+
+    for target, (results, last_error) in zip(valid_targets, rounds):
+        stats = get_stats(results)
+        if stats is None:
+            continue
+        msg = format_stats(target["name"], stats)
+        if last_error is not None:
+            msg += f" | last error: {describe_error(last_error)}"
+
+        # Alerts are based on this check only, the history just smooths the heartbeat percentiles
+        if stats["loss"] >= 100:
+            loggers.NET.error(f"UNREACHABLE: {msg}")
+        elif stats["loss"] > configuration.NET_LOSS_THRESHOLD:
+            loggers.NET.warning(f"PACKET LOSS: {msg}")
+        elif stats["p95"] > configuration.NET_LATENCY_THRESHOLD:
+            loggers.NET.warning(f"HIGH LATENCY: {msg}")
+
+        if log_heartbeat:
+            loggers.NET.info(f"Heartbeat: {format_stats(target['name'], get_stats(_history[target['name']]))}")
@@ -0,0 +1,15 @@
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import configuration
+
+# Service loggers create their directories on import, keep them out of the home directory
+_log_dir = tempfile.TemporaryDirectory(prefix="pi-logger-test-")
+configuration.BASE_LOG_DIR = Path(_log_dir.name)
+
+
+def pytest_unconfigure(config):
+    _log_dir.cleanup()